@@ -29,11 +29,12 @@ COLOR_ROOT = "#F39C12"         # 词根颜色（橙色）
 COLOR_SEPARATOR = "#34495E"    # 分隔线颜色（深灰）
 COLOR_EXAMPLES = "#C0E6FF"     # 真题意群文本颜色（浅蓝）
 
-# 快捷键配置
-HOTKEY_RESELECT = 'F2'     # 重新选择区域
-HOTKEY_TOGGLE = 'F3'       # 显示/隐藏悬浮窗
-HOTKEY_PAUSE = 'F4'        # 暂停/继续识别
-HOTKEY_EXIT = 'ESC'        # 退出程序
+# 快捷键配置（必须带修饰键：Windows 上注册的热键会被本程序独占，单独的 F2/ESC 会让其他程序收不到；
+# 字母键避免用 Ctrl+Alt，部分键盘布局上它等同于 AltGr，会吞掉 AltGr 输入的字符）
+HOTKEY_RESELECT = 'ctrl+alt+F2'     # 重新选择区域
+HOTKEY_TOGGLE = 'ctrl+alt+F3'       # 显示/隐藏悬浮窗
+HOTKEY_PAUSE = 'ctrl+alt+F4'        # 暂停/继续识别
+HOTKEY_EXIT = 'ctrl+shift+Q'        # 退出程序
 
 # 已弃用 Tesseract，现使用 RapidOCR（无需配置）
 # 数据库文件路径
@@ -45,7 +46,7 @@ FUZZY_MATCH_THRESHOLD = 0.9
 # 调试模式
 DEBUG = True
 
-# 屏幕相似度跳过 OCR 的阈值（基于 aHash 的汉明距离，0-64，越小越严格）
+# 屏幕相似度跳过 OCR 的阈值（基于 dHash 的汉明距离，0-64，越小越严格）
 IMAGE_HASH_DIFF_THRESHOLD = 2
 
 # OCR 性能优化
@@ -53,4 +54,11 @@ OCR_FAST_MODE = True           # 开启快速模式：灰度+二值化+下采样
 OCR_DOWNSCALE = 0.9          # 下采样比例（0-1，越小越快）
 OCR_MAX_WIDTH = 9000            # OCR 输入的最大宽度（像素）
 OCR_BIN_THRESHOLD = 180        # 二值化阈值（0-255）
+OCR_NUM_THREADS = 0            # 模型推理线程数（0 = 自动，取物理核数，约为逻辑核数的一半）
+
+# 自定义 RapidOCR 模型文件（留空使用内置 FP32 模型）
+# 可指向 INT8 量化模型以换取速度，但需在支持 VNNI 的 CPU 上实测速度和准确率后再启用
+OCR_DET_MODEL_PATH = ""        # 文字检测模型
+OCR_CLS_MODEL_PATH = ""        # 方向分类模型
+OCR_REC_MODEL_PATH = ""        # 文字识别模型
 
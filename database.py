@@ -3,34 +3,115 @@
 解析 HTML 文件中的单词和词根数据，构建索引字典
 """
 
+import glob
+import math
+import os
+import pickle
 import re
-from bs4 import BeautifulSoup
-from typing import Dict, List, Optional
-import difflib
+import sys
+from collections import OrderedDict, defaultdict
+import ahocorasick
+from lxml import etree
+from typing import Dict, List, Optional, Tuple
+from rapidfuzz import fuzz, process
 import config
 
 
+# 预编译的正则表达式（解析和查询时反复使用）
+_LEADING_ALPHA_RE = re.compile(r'^[a-zA-Z]')
+_WORD_RE = re.compile(r'^([a-zA-Z]+(?:\s+[a-zA-Z]+)?)\s*/([^/]+)/(.*)$')
+_EXAMPLES_RE = re.compile(r'【真题意群】([^【]+)')
+_SYN_RE = re.compile(r'(?:同义|近义)[：:]?\s*([a-zA-Z\s,;]+)')
+_SPLIT_RE = re.compile(r'[,;]')
+_CJK_RE = re.compile(r'[\u4e00-\u9fa5]')
+_PUNCT_RE = re.compile(r'[.;，；、]')
+_ALPHA_RE = re.compile(r'[a-zA-Z]+')
+_TOKEN_RE = re.compile(r'\S+')
+
+# 解析结果磁盘缓存的格式版本（解析逻辑变化时递增，使旧缓存失效）
+_CACHE_VERSION = 3
+
+# 悬浮窗中释义的最大显示长度
+_DEFINITION_DISPLAY_LEN = 150
+
+# 悬浮窗中最多显示的真题意群条数
+_EXAMPLES_DISPLAY_COUNT = 2
+
+# 模糊查询结果缓存容量（OCR 会反复把同一个单词识别成同样的错误拼写）
+_FUZZY_CACHE_SIZE = 1024
+
+
 class WordDatabase:
     def __init__(self, html_file: str):
         """初始化数据库，解析 HTML 文件"""
         self.html_file = html_file
         self.word_dict: Dict[str, dict] = {}  # 单词 -> 完整信息
         self.root_dict: Dict[str, str] = {}   # 词根 -> 含义
-        self.word_list: List[str] = []        # 所有单词列表（用于模糊匹配）
+        # 首字母 -> 长度 -> 单词（模糊匹配剪枝）
+        self._by_first: Dict[str, Dict[int, List[str]]] = defaultdict(lambda: defaultdict(list))
+        # 模糊查询缓存：规范化单词 -> 匹配结果（含未命中），LRU 淘汰
+        self._fuzzy_cache: 'OrderedDict[str, Optional[dict]]' = OrderedDict()
         
-        self._parse_html()
+        if not self._load_cache():
+            self._parse_html()
+            self._save_cache()
+        self._build_word_index()
+        self._build_root_automaton()
+        self._build_fallback_roots()
         print(f"✅ 数据库加载完成：{len(self.word_dict)} 个单词，{len(self.root_dict)} 个词根")
     
-    def _parse_html(self):
-        """解析 HTML 文件"""
-        with open(self.html_file, 'r', encoding='utf-8') as f:
-            content = f.read()
+    def _cache_path(self) -> str:
+        """解析缓存文件路径，以源文件的修改时间和大小区分版本"""
+        st = os.stat(self.html_file)
+        debug = 1 if config.DEBUG else 0
+        return f"{self.html_file}.cache-v{_CACHE_VERSION}-{debug}-{st.st_mtime_ns}-{st.st_size}.pkl"
+    
+    def _load_cache(self) -> bool:
+        """尝试从磁盘缓存加载解析结果
         
-        soup = BeautifulSoup(content, 'html.parser')
-        paragraphs = soup.find_all('p')
+        Returns:
+            是否加载成功
+        """
+        try:
+            with open(self._cache_path(), 'rb') as f:
+                self.word_dict, self.root_dict = pickle.load(f)
+            return True
+        except FileNotFoundError:
+            return False
+        except Exception as e:
+            print(f"⚠️ 读取数据库缓存失败，将重新解析: {e}")
+            return False
+    
+    def _save_cache(self):
+        """将解析结果写入磁盘缓存，并清理旧版本的缓存文件"""
+        try:
+            path = self._cache_path()
+            for old in glob.glob(glob.escape(self.html_file) + '.cache-*.pkl'):
+                if old != path:
+                    os.remove(old)
+            with open(path, 'wb') as f:
+                pickle.dump((self.word_dict, self.root_dict), f, protocol=pickle.HIGHEST_PROTOCOL)
+        except Exception as e:
+            print(f"⚠️ 写入数据库缓存失败: {e}")
+    
+    def _parse_html(self):
+        """解析 HTML 文件
+
+        使用 lxml.iterparse 流式读取，只在每个 <p> 结束时取出文本，
+        处理完立即释放节点，不在内存中保留整棵 DOM 树
+        """
+        context = etree.iterparse(
+            self.html_file, events=('end',), tag='p', html=True, huge_tree=True
+        )
         
-        for p in paragraphs:
-            text = p.get_text(strip=True)
+        for _, elem in context:
+            # 逐段去除空白后拼接（与原先 get_text(strip=True) 的结果一致）
+            text = ''.join(s.strip() for s in elem.itertext())
+            
+            # 释放已处理的节点
+            elem.clear()
+            while elem.getprevious() is not None:
+                del elem.getparent()[0]
             
             # 跳过空行和短行
             if not text or len(text) < 3:
@@ -40,50 +121,86 @@ class WordDatabase:
             if text.startswith('△'):
                 self._parse_root(text)
             # 识别单词条目（包含音标斜杠）
-            elif '/' in text and re.match(r'^[a-zA-Z]', text):
+            elif '/' in text and _LEADING_ALPHA_RE.match(text):
                 self._parse_word(text)
     
+    def _build_word_index(self):
+        """按首字母和长度为全部单词建立分桶索引（直接取自 word_dict，不另存单词列表）"""
+        self._by_first.clear()
+        for word in self.word_dict:
+            self._by_first[word[0]][len(word)].append(word)
+    
+    def _build_root_automaton(self):
+        """用所有长度≥3的词根构建 Aho-Corasick 自动机，
+        查询时一次扫描单词即可找出其中包含的全部词根"""
+        self._root_automaton = ahocorasick.Automaton()
+        for index, root in enumerate(self.root_dict):
+            if len(root) >= 3:
+                # 值按 (长度降序, 原始顺序) 排序，与逐个词根扫描时的优先级一致
+                self._root_automaton.add_word(root, (-len(root), index, root))
+        if len(self._root_automaton):
+            self._root_automaton.make_automaton()
+    
+    def _build_fallback_roots(self):
+        """预先计算每个单词中包含的词根（兜底匹配用），查询时只需取字典"""
+        self._fallback_roots: Dict[str, List[tuple]] = {
+            word: self._scan_roots(word) for word in self.word_dict
+        }
+    
+    def _scan_roots(self, word: str) -> List[tuple]:
+        """扫描单词中包含的词根
+        
+        仅考虑长度≥3的词根，按长度从长到短，最多取3个，避免噪声
+        """
+        related: List[tuple] = []
+        if not len(self._root_automaton):
+            return related
+        found = {value for _, value in self._root_automaton.iter(word)}
+        for _, _, root in sorted(found):
+            if all(root not in r[0].lower() for r in related):
+                related.append((root, self.root_dict[root]))
+                if len(related) >= 3:
+                    break
+        return related
+    
     def _parse_root(self, text: str):
         """解析词根条目
         格式: △ act=做 驱使
         """
-        # 移除 △ 符号
-        text = text.replace('△', '').strip()
-        
-        if '=' in text:
-            parts = text.split('=', 1)
-            if len(parts) == 2:
-                root_variants = parts[0].strip()
-                meaning = parts[1].strip()
-                
-                # 处理多个词根变体（如 "al alter altern"）
-                roots = root_variants.split()
-                for root in roots:
-                    root = root.strip()
-                    if root:
-                        self.root_dict[root.lower()] = meaning
+        # 移除开头的 △ 符号，按第一个 = 切分出词根变体和含义
+        root_variants, sep, meaning = text.lstrip('△ \t').partition('=')
+        if not sep:
+            return
+        meaning = meaning.strip()
+        
+        # 处理多个词根变体（如 "al alter altern"）
+        for m in _TOKEN_RE.finditer(root_variants.lower()):
+            self.root_dict[m.group()] = meaning
     
     def _parse_word(self, text: str):
         """解析单词条目
         格式: word /phonetic/=root_split=root_meaning=definition...
         """
         # 匹配基本格式: 单词 + 音标
-        match = re.match(r'^([a-zA-Z]+(?:\s+[a-zA-Z]+)?)\s*/([^/]+)/(.*)$', text)
+        match = _WORD_RE.match(text)
         if not match:
             return
         
         word, phonetic, rest = match.groups()
-        word = word.strip().lower()
-        phonetic = phonetic.strip()
+        # 驻留高频重复的短字符串，减少常驻内存
+        word = sys.intern(word.strip().lower())
+        phonetic = sys.intern(f'/{phonetic.strip()}/')
         
         # 解析等号分隔的部分
         parts = rest.split('=')
         
         word_info = {
             'word': word,
-            'phonetic': f'/{phonetic}/',
-            'raw_text': text
+            'phonetic': phonetic
         }
+        # 原始段落只在调试时保留（正常流程不会读取）
+        if config.DEBUG:
+            word_info['raw_text'] = text
         
         # 尝试提取结构化信息
         if len(parts) >= 1:
@@ -97,7 +214,7 @@ class WordDatabase:
             if root_split_index >= 0 and root_split_index + 2 < len(parts):
                 # 找到了词根拆分结构
                 word_info['root_split'] = parts[root_split_index].strip()
-                word_info['root_meaning'] = parts[root_split_index + 1].strip()
+                word_info['root_meaning'] = sys.intern(parts[root_split_index + 1].strip())
                 word_info['definition'] = parts[root_split_index + 2].strip()
                 
                 # 如果还有更多内容
@@ -114,9 +231,9 @@ class WordDatabase:
                     if s.lower() == word:
                         return False
                     # 含中文或常见释义标记更优
-                    if re.search(r'[\u4e00-\u9fa5]', s):
+                    if _CJK_RE.search(s):
                         return True
-                    if re.search(r'[.;，；、]', s):
+                    if _PUNCT_RE.search(s):
                         return True
                     # 纯英文短语也允许作为兜底
                     return True
@@ -131,23 +248,31 @@ class WordDatabase:
             word_info['definition'] = rest.strip()
         
         # 提取【真题意群】
-        examples = re.findall(r'【真题意群】([^【]+)', text)
+        examples = _EXAMPLES_RE.findall(text)
         if examples:
             word_info['examples'] = [ex.strip() for ex in examples]
+            # 悬浮窗显示用的文本（最多2个），加载时预先排版
+            word_info['examples_text'] = "\n".join(
+                f"   {ex}" for ex in word_info['examples'][:_EXAMPLES_DISPLAY_COUNT]
+            )
         
         # 清理释义中的“真题意群”片段，避免 UI 重复展示
         if 'definition' in word_info:
-            cleaned = re.sub(r'【真题意群】[^【]+', '', word_info['definition']).strip()
+            cleaned = _EXAMPLES_RE.sub('', word_info['definition']).strip()
             word_info['definition'] = cleaned
+            # 悬浮窗显示用的截断版本，加载时算好，避免每次刷新界面都重新切片
+            if len(cleaned) > _DEFINITION_DISPLAY_LEN:
+                word_info['definition_short'] = cleaned[:_DEFINITION_DISPLAY_LEN] + "..."
+            else:
+                word_info['definition_short'] = cleaned
         
         # 提取同义词/反义词（通常在末尾）
-        synonyms = re.findall(r'(?:同义|近义)[：:]?\s*([a-zA-Z\s,;]+)', text)
+        synonyms = _SYN_RE.findall(text)
         if synonyms:
-            word_info['synonyms'] = [s.strip() for s in re.split(r'[,;]', synonyms[0]) if s.strip()]
+            word_info['synonyms'] = [s.strip() for s in _SPLIT_RE.split(synonyms[0]) if s.strip()]
         
         # 存储到字典
         self.word_dict[word] = word_info
-        self.word_list.append(word)
     
     def lookup(self, word: str, fuzzy: bool = True) -> Optional[dict]:
         """查询单词
@@ -159,35 +284,154 @@ class WordDatabase:
         Returns:
             单词信息字典，如果未找到返回 None
         """
-        word = word.lower().strip()
+        # OCR 提取的单词已是小写且无空白，先用原文直接命中，省去规范化的字符串分配
+        word_info = self.word_dict.get(word)
+        if word_info is not None:
+            return word_info
+        
+        word = word.strip().lower()
+        
+        # 第一层：精确命中直接取 word_dict，本身就是 O(1) 哈希查找
+        word_info = self.word_dict.get(word)
+        if word_info is not None or not fuzzy:
+            return word_info
         
-        # 精确匹配
-        if word in self.word_dict:
-            return self.word_dict[word]
+        # 第二层：模糊匹配结果的 LRU 缓存，反复出现的 OCR 误识别不再重复打分
+        cache = self._fuzzy_cache
+        if word in cache:
+            cache.move_to_end(word)
+            return cache[word]
         
-        # 模糊匹配
-        if fuzzy and len(word) > 3:
-            # 使用 difflib 找到最接近的单词
+        result = self._fuzzy_lookup(word)
+        cache[word] = result
+        if len(cache) > _FUZZY_CACHE_SIZE:
+            cache.popitem(last=False)
+        return result
+    
+    def _fuzzy_lookup(self, word: str) -> Optional[dict]:
+        """模糊查询单词（不经过缓存），word 需已规范化为小写"""
+        if len(word) > 3:
+            # 使用 RapidFuzz 找到最接近的单词（score_cutoff 可提前剪枝）
             cutoff = getattr(config, 'FUZZY_MATCH_THRESHOLD', 0.85)
-            matches = difflib.get_close_matches(word, self.word_list, n=1, cutoff=cutoff)
-            if matches:
-                matched_word = matches[0]
-                # 计算相似度分数
-                ratio = difflib.SequenceMatcher(None, word, matched_word).ratio()
-                # 额外约束：首字母不同且长度>=5时，提高阈值，避免 massive→passive 这类误判
-                extra = 0.0
-                if len(word) >= 5 and word[0] != matched_word[0]:
-                    extra = 0.07
-                if ratio >= cutoff + extra:
-                    result = self.word_dict[matched_word].copy()
-                    result['fuzzy_match'] = True
-                    result['original_query'] = word
-                    result['matched_word'] = matched_word
-                    result['fuzzy_score'] = ratio
-                    return result
+            hit = process.extractOne(
+                word, self._fuzzy_candidates(word, cutoff),
+                scorer=fuzz.ratio, score_cutoff=cutoff * 100
+            )
+            if hit:
+                matched_word, score, _ = hit
+                return self._fuzzy_result(word, matched_word, score / 100, cutoff)
         
         return None
     
+    def _fuzzy_result(self, word: str, matched_word: str, ratio: float, cutoff: float) -> Optional[dict]:
+        """根据相似度构造模糊匹配结果，未达到阈值时返回 None"""
+        # 额外约束：首字母不同且长度>=5时，提高阈值，避免 massive→passive 这类误判
+        extra = 0.0
+        if len(word) >= 5 and word[0] != matched_word[0]:
+            extra = 0.07
+        if ratio < cutoff + extra:
+            return None
+        result = self.word_dict[matched_word].copy()
+        result['fuzzy_match'] = True
+        result['original_query'] = word
+        result['matched_word'] = matched_word
+        result['fuzzy_score'] = ratio
+        return result
+    
+    def lookup_batch(self, words: List[str], fuzzy: bool = True) -> List[Optional[dict]]:
+        """批量查询单词
+        
+        精确命中和缓存命中直接返回，其余单词按（首字母, 长度）分组，
+        每组用 RapidFuzz 的 cdist 一次性计算与该组候选词的相似度矩阵（C++ 实现，多线程）。
+        候选词与平局时的先后顺序都和 lookup 相同，两者对同一单词的结果一致
+        
+        Args:
+            words: 要查询的单词列表
+            fuzzy: 是否启用模糊匹配
+        
+        Returns:
+            与 words 一一对应的单词信息列表，未找到的位置为 None
+        """
+        results: List[Optional[dict]] = [None] * len(words)
+        pending: Dict[str, List[int]] = {}  # 待模糊匹配的单词 -> 在 words 中的位置
+        cache = self._fuzzy_cache
+        
+        for i, word in enumerate(words):
+            word = word.lower().strip()
+            word_info = self.word_dict.get(word)
+            if word_info is not None:
+                results[i] = word_info
+            elif not fuzzy or len(word) <= 3:
+                continue
+            elif word in cache:
+                cache.move_to_end(word)
+                results[i] = cache[word]
+            else:
+                pending.setdefault(word, []).append(i)
+        
+        if not pending:
+            return results
+        
+        # 候选词只取决于首字母和长度，同组单词共用一份候选列表
+        groups: Dict[Tuple[str, int], List[str]] = {}
+        for word in pending:
+            groups.setdefault((word[0], len(word)), []).append(word)
+        
+        cutoff = getattr(config, 'FUZZY_MATCH_THRESHOLD', 0.85)
+        for queries in groups.values():
+            choices = self._fuzzy_candidates(queries[0], cutoff)
+            best_matches = [None] * len(queries)
+            if choices:
+                scores = process.cdist(
+                    queries, choices,
+                    scorer=fuzz.ratio, score_cutoff=cutoff * 100, workers=-1
+                )
+                # argmax 在平局时取第一个，与 extractOne 一致（同首字母的候选排在前面）
+                best = scores.argmax(axis=1)
+                for row in range(len(queries)):
+                    col = int(best[row])
+                    score = float(scores[row, col])
+                    if score > 0:
+                        best_matches[row] = (choices[col], score)
+            
+            for word, match in zip(queries, best_matches):
+                result = None
+                if match is not None:
+                    result = self._fuzzy_result(word, match[0], match[1] / 100, cutoff)
+                cache[word] = result
+                for i in pending[word]:
+                    results[i] = result
+        
+        while len(cache) > _FUZZY_CACHE_SIZE:
+            cache.popitem(last=False)
+        return results
+    
+    def _fuzzy_candidates(self, word: str, cutoff: float) -> List[str]:
+        """按首字母和长度筛选可能达到阈值的候选词
+        
+        - 首字母：只取同首字母及其字母表相邻的两个桶，
+          首字母不同的匹配本身还要再过更高的阈值
+        - 长度：ratio = 2*公共字符数/(len1+len2) ≤ 2*min/(len1+len2)，
+          由此可推出候选长度的上下界，界外的单词不可能达到 cutoff
+        """
+        n = len(word)
+        if cutoff > 0:
+            # 两端各放宽 1，避免浮点误差漏掉边界上的候选
+            lo = max(1, math.ceil(n * cutoff / (2 - cutoff)) - 1)
+            hi = int(n * (2 - cutoff) / cutoff) + 1
+        else:
+            lo, hi = 1, math.inf
+        
+        first = ord(word[0])
+        candidates: List[str] = []
+        for ch in (chr(first), chr(first - 1), chr(first + 1)):
+            by_len = self._by_first.get(ch)
+            if by_len:
+                for length, words in by_len.items():
+                    if lo <= length <= hi:
+                        candidates.extend(words)
+        return candidates
+    
     def lookup_root(self, root: str) -> Optional[str]:
         """查询词根含义
         
@@ -214,7 +458,7 @@ class WordDatabase:
         # 优先：从结构化的 root_split 中提取
         if 'root_split' in word_info:
             root_split = word_info['root_split']
-            roots = re.findall(r'[a-zA-Z]+', root_split)
+            roots = _ALPHA_RE.findall(root_split)
             for root in roots:
                 root_lower = root.lower()
                 if root_lower in self.root_dict:
@@ -227,16 +471,11 @@ class WordDatabase:
         if not word:
             return related
         
-        # 仅考虑长度≥3的词根，按长度从长到短，最多取3个，避免噪声
-        for root in sorted(self.root_dict.keys(), key=len, reverse=True):
-            if len(root) < 3:
-                break
-            if root in word and all(root.lower() not in r[0].lower() for r in related):
-                related.append((root, self.root_dict[root]))
-                if len(related) >= 3:
-                    break
-        
-        return related
+        # 词库中的单词已在加载时预先计算，其余单词（如模糊查询原文）现场扫描
+        fallback = self._fallback_roots.get(word)
+        if fallback is None:
+            fallback = self._scan_roots(word)
+        return list(fallback)
 
 
 if __name__ == '__main__':
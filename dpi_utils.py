@@ -5,29 +5,18 @@ DPI 工具模块
 
 import sys
 import platform
+import functools
 
 
 class DPIManager:
-    """DPI 管理器"""
-    
-    _instance = None
-    _initialized = False
-    
-    def __new__(cls):
-        if cls._instance is None:
-            cls._instance = super().__new__(cls)
-        return cls._instance
+    """DPI 管理器（通过 get_dpi_manager() 获取共享实例）"""
     
     def __init__(self):
         """初始化 DPI 管理器"""
-        if DPIManager._initialized:
-            return
-        
         self.scale_factor = 1.0
         self._setup_dpi_awareness()
         self._get_scale_factor()
-        
-        DPIManager._initialized = True
+        self._bind_coordinate_converters()
     
     def _setup_dpi_awareness(self):
         """设置 DPI 感知（仅 Windows）"""
@@ -66,10 +55,15 @@ class DPIManager:
         try:
             import ctypes
             
+            # 先取出函数指针，避免每次经由 windll 代理重复解析
+            user32 = ctypes.windll.user32
+            get_dc, release_dc = user32.GetDC, user32.ReleaseDC
+            get_device_caps = ctypes.windll.gdi32.GetDeviceCaps
+            
             # 获取主显示器的 DPI
-            hdc = ctypes.windll.user32.GetDC(0)
-            dpi = ctypes.windll.gdi32.GetDeviceCaps(hdc, 88)  # 88 = LOGPIXELSX
-            ctypes.windll.user32.ReleaseDC(0, hdc)
+            hdc = get_dc(0)
+            dpi = get_device_caps(hdc, 88)  # 88 = LOGPIXELSX
+            release_dc(0, hdc)
             
             # 计算缩放因子（标准DPI是96）
             self.scale_factor = dpi / 96.0
@@ -83,73 +77,48 @@ class DPIManager:
             print(f"   ⚠️ 获取缩放因子时出错: {e}")
             self.scale_factor = 1.0
     
-    def get_scale_factor(self) -> float:
-        """获取当前的缩放因子
-        
-        Returns:
-            缩放因子（例如 1.25 表示 125% 缩放）
-        """
-        return self.scale_factor
-    
-    def scale_coordinates(self, x: int, y: int, width: int, height: int):
-        """将逻辑坐标转换为物理坐标（用于截图）
+    def _bind_coordinate_converters(self):
+        """按缩放因子绑定坐标转换函数
         
-        Args:
-            x: X 坐标
-            y: Y 坐标
-            width: 宽度
-            height: 高度
+        缩放因子在进程生命周期内不变，这里直接生成恒等函数或闭包，
+        省去每次调用时的判断和属性查找。绑定后实例上提供：
         
-        Returns:
-            缩放后的坐标元组 (x, y, width, height)
+        scale_coordinates(x, y, width, height):
+            将逻辑坐标转换为物理坐标（用于截图），返回 (x, y, width, height)
+        unscale_coordinates(x, y, width, height):
+            将物理坐标转换为逻辑坐标，返回 (x, y, width, height)
         """
-        if self.scale_factor == 1.0:
-            return (x, y, width, height)
+        s = self.scale_factor
+        if s == 1.0:
+            identity = lambda x, y, width, height: (x, y, width, height)
+            self.scale_coordinates = identity
+            self.unscale_coordinates = identity
+            return
         
-        return (
-            int(x * self.scale_factor),
-            int(y * self.scale_factor),
-            int(width * self.scale_factor),
-            int(height * self.scale_factor)
+        self.scale_coordinates = lambda x, y, width, height: (
+            int(x * s), int(y * s), int(width * s), int(height * s)
+        )
+        self.unscale_coordinates = lambda x, y, width, height: (
+            int(x / s), int(y / s), int(width / s), int(height / s)
         )
     
-    def unscale_coordinates(self, x: int, y: int, width: int, height: int):
-        """将物理坐标转换为逻辑坐标
-        
-        Args:
-            x: X 坐标
-            y: Y 坐标
-            width: 宽度
-            height: 高度
+    def get_scale_factor(self) -> float:
+        """获取当前的缩放因子
         
         Returns:
-            反缩放后的坐标元组 (x, y, width, height)
+            缩放因子（例如 1.25 表示 125% 缩放）
         """
-        if self.scale_factor == 1.0:
-            return (x, y, width, height)
-        
-        return (
-            int(x / self.scale_factor),
-            int(y / self.scale_factor),
-            int(width / self.scale_factor),
-            int(height / self.scale_factor)
-        )
-
-
-# 全局 DPI 管理器实例
-_dpi_manager = None
+        return self.scale_factor
 
 
+@functools.lru_cache(maxsize=None)
 def get_dpi_manager() -> DPIManager:
     """获取 DPI 管理器实例
     
     Returns:
         DPI 管理器单例
     """
-    global _dpi_manager
-    if _dpi_manager is None:
-        _dpi_manager = DPIManager()
-    return _dpi_manager
+    return DPIManager()
 
 
 def setup_tkinter_dpi(root):
@@ -6,11 +6,18 @@
 
 import tkinter as tk
 from tkinter import font as tkfont
-from typing import Optional, Dict, List, Tuple
+from typing import Callable, Optional, Dict, List, Tuple
 import config
 from dpi_utils import setup_tkinter_dpi
 
 
+def _set_fg(widget: tk.Widget, color: str):
+    """设置前景色，颜色未变化时跳过（每次 config 都要往返 Tcl 并重新解析颜色）"""
+    if getattr(widget, '_cur_fg', None) != color:
+        widget.config(fg=color)
+        widget._cur_fg = color
+
+
 class FloatingWindow:
     def __init__(self):
         """初始化悬浮窗"""
@@ -27,6 +34,8 @@ class FloatingWindow:
         
         # 设置初始大小和位置
         self.root.geometry(f"{config.WINDOW_WIDTH}x{config.WINDOW_MIN_HEIGHT}+100+100")
+        self._height = config.WINDOW_MIN_HEIGHT
+        self._fit_scheduled = False
         
         # 设置背景色
         self.root.configure(bg=config.COLOR_BG)
@@ -53,6 +62,9 @@ class FloatingWindow:
         # 初始化字体
         self._init_fonts()
         
+        # 创建可复用的内容控件
+        self._create_content_widgets()
+        
         # 显示欢迎信息
         self._show_welcome()
         
@@ -61,6 +73,9 @@ class FloatingWindow:
         
         # 隐藏标志
         self.is_hidden = False
+        
+        # 隐藏期间收到的最新一次刷新，重新显示时再应用
+        self._pending_update: Optional[Tuple[Callable, tuple]] = None
     
     def _init_fonts(self):
         """初始化字体"""
@@ -118,8 +133,8 @@ class FloatingWindow:
         )
         close_btn.pack(side=tk.RIGHT)
         close_btn.bind('<Button-1>', lambda e: self.hide())
-        close_btn.bind('<Enter>', lambda e: close_btn.config(fg='#E74C3C'))
-        close_btn.bind('<Leave>', lambda e: close_btn.config(fg=config.COLOR_PHONETIC))
+        close_btn.bind('<Enter>', lambda e: _set_fg(close_btn, '#E74C3C'))
+        close_btn.bind('<Leave>', lambda e: _set_fg(close_btn, config.COLOR_PHONETIC))
     
     def _start_drag(self, event):
         """开始拖动"""
@@ -134,6 +149,101 @@ class FloatingWindow:
         y = self.root.winfo_y() + deltay
         self.root.geometry(f"+{x}+{y}")
     
+    def _create_content_widgets(self):
+        """预先创建内容区的全部控件
+        
+        更新单词时只修改文本并切换显示，不再反复创建/销毁控件
+        """
+        def label(font, fg, **kwargs):
+            return tk.Label(self.content_frame, font=font, bg=config.COLOR_BG, fg=fg, **kwargs)
+        
+        def separator():
+            return tk.Frame(self.content_frame, height=1, bg=config.COLOR_SEPARATOR)
+        
+        def section_title(text):
+            return label(self.font_body, config.COLOR_SECTION_TITLE, text=text)
+        
+        # 提示信息（欢迎、未找到）
+        self.message_label = label(self.font_body, config.COLOR_BODY, justify=tk.LEFT)
+        
+        # 单词、模糊匹配提示、音标
+        self.word_label = label(self.font_word, config.COLOR_WORD)
+        self.warn_label = label(self.font_body, "#F1C40F")
+        self.phonetic_label = label(self.font_phonetic, config.COLOR_PHONETIC)
+        
+        # 词根拆分
+        self.root_split_sep = separator()
+        self.root_split_title = section_title("📖 词根拆分")
+        self.root_split_label = label(self.font_body, config.COLOR_BODY)
+        self.root_meaning_label = label(self.font_body, config.COLOR_BODY)
+        
+        # 释义
+        self.def_sep = separator()
+        self.def_title = section_title("💡 释义")
+        self.def_label = label(
+            self.font_body, config.COLOR_BODY,
+            wraplength=config.WINDOW_WIDTH - 50, justify=tk.LEFT
+        )
+        
+        # 真题意群
+        self.examples_sep = separator()
+        self.examples_title = section_title("🧪 真题意群")
+        self.examples_label = label(
+            self.font_root, config.COLOR_EXAMPLES,
+            wraplength=config.WINDOW_WIDTH - 50, justify=tk.LEFT
+        )
+        
+        # 相关词根（最多显示5个）
+        self.roots_sep = separator()
+        self.roots_title = section_title("🌱 相关词根")
+        self.root_labels = [label(self.font_root, config.COLOR_ROOT) for _ in range(5)]
+        
+        # 按显示顺序排列的 (控件, pack 参数)
+        sep_opts = {'fill': tk.X, 'pady': 8}
+        title_opts = {'anchor': tk.W, 'pady': (5, 3)}
+        self._layout = [
+            (self.message_label, {'pady': 20}),
+            (self.word_label, {'anchor': tk.W}),
+            (self.warn_label, {'anchor': tk.W, 'pady': (2, 8)}),
+            (self.phonetic_label, {'anchor': tk.W, 'pady': (2, 10)}),
+            (self.root_split_sep, sep_opts),
+            (self.root_split_title, title_opts),
+            (self.root_split_label, {'anchor': tk.W}),
+            (self.root_meaning_label, {'anchor': tk.W}),
+            (self.def_sep, sep_opts),
+            (self.def_title, title_opts),
+            (self.def_label, {'anchor': tk.W}),
+            (self.examples_sep, sep_opts),
+            (self.examples_title, title_opts),
+            (self.examples_label, {'anchor': tk.W, 'pady': (2, 0)}),
+            (self.roots_sep, sep_opts),
+            (self.roots_title, title_opts),
+        ] + [(root_label, {'anchor': tk.W}) for root_label in self.root_labels]
+        self._visible: set = set()  # 当前显示的控件
+    
+    def _show_widgets(self, visible: List[tk.Widget]):
+        """只显示给定的控件，并按布局顺序重新排列
+        
+        显示的控件集合不变时（连续识别到结构相同的单词）直接跳过，
+        只保留文本修改，避免整批 pack_forget/pack 触发的重新布局
+        """
+        visible_set = set(visible)
+        if visible_set == self._visible:
+            return
+        self._visible = visible_set
+        
+        for widget, _ in self._layout:
+            widget.pack_forget()
+        for widget, opts in self._layout:
+            if widget in visible_set:
+                widget.pack(**opts)
+    
+    def _show_message(self, text: str, fg: str):
+        """在内容区只显示一段提示信息"""
+        self.message_label.config(text=text)
+        _set_fg(self.message_label, fg)
+        self._show_widgets([self.message_label])
+    
     def _show_welcome(self):
         """显示欢迎信息"""
         welcome_text = (
@@ -146,30 +256,7 @@ class FloatingWindow:
             f"  {config.HOTKEY_EXIT} - 退出\n\n"
             "等待识别单词..."
         )
-        
-        label = tk.Label(
-            self.content_frame,
-            text=welcome_text,
-            font=self.font_body,
-            bg=config.COLOR_BG,
-            fg=config.COLOR_BODY,
-            justify=tk.LEFT
-        )
-        label.pack(pady=20)
-    
-    def _clear_content(self):
-        """清空内容区域"""
-        for widget in self.content_frame.winfo_children():
-            widget.destroy()
-    
-    def _add_separator(self):
-        """添加分隔线"""
-        sep = tk.Frame(
-            self.content_frame,
-            height=1,
-            bg=config.COLOR_SEPARATOR
-        )
-        sep.pack(fill=tk.X, pady=8)
+        self._show_message(welcome_text, config.COLOR_BODY)
     
     def update_word(self, word_info: Dict, related_roots: List[Tuple[str, str]]):
         """更新显示的单词信息
@@ -178,157 +265,70 @@ class FloatingWindow:
             word_info: 单词信息字典
             related_roots: 相关词根列表 [(词根, 含义), ...]
         """
-        self._clear_content()
+        if self.is_hidden:
+            self._pending_update = (self.update_word, (word_info, related_roots))
+            return
         
         # 显示单词和音标
-        word_text = word_info['word'].upper()
-        
-        word_label = tk.Label(
-            self.content_frame,
-            text=word_text,
-            font=self.font_word,
-            bg=config.COLOR_BG,
-            fg=config.COLOR_WORD
-        )
-        word_label.pack(anchor=tk.W)
+        self.word_label.config(text=word_info['word'].upper())
+        self.phonetic_label.config(text=word_info['phonetic'])
+        visible = [self.word_label, self.phonetic_label]
 
         # 如果是模糊匹配，且原始识别与词库单词不同，显著提示“词库未收录”
         if word_info.get('fuzzy_match') and word_info.get('original_query') and word_info.get('matched_word'):
             original = word_info['original_query']
             matched = word_info['matched_word']
             if original != matched:
-                warn = tk.Label(
-                    self.content_frame,
-                    text=f"⚠️  词库未收录: {original}  · 最接近: {matched}",
-                    font=self.font_body,
-                    bg=config.COLOR_BG,
-                    fg="#F1C40F"
-                )
-                warn.pack(anchor=tk.W, pady=(2, 8))
-        
-        phonetic_label = tk.Label(
-            self.content_frame,
-            text=word_info['phonetic'],
-            font=self.font_phonetic,
-            bg=config.COLOR_BG,
-            fg=config.COLOR_PHONETIC
-        )
-        phonetic_label.pack(anchor=tk.W, pady=(2, 10))
+                self.warn_label.config(text=f"⚠️  词库未收录: {original}  · 最接近: {matched}")
+                visible.append(self.warn_label)
         
         # 显示词根拆分
         if 'root_split' in word_info and 'root_meaning' in word_info:
-            self._add_separator()
-            
-            section_label = tk.Label(
-                self.content_frame,
-                text="📖 词根拆分",
-                font=self.font_body,
-                bg=config.COLOR_BG,
-                fg=config.COLOR_SECTION_TITLE
-            )
-            section_label.pack(anchor=tk.W, pady=(5, 3))
-            
-            split_label = tk.Label(
-                self.content_frame,
-                text=f"   {word_info['root_split']}",
-                font=self.font_body,
-                bg=config.COLOR_BG,
-                fg=config.COLOR_BODY
-            )
-            split_label.pack(anchor=tk.W)
-            
-            meaning_label = tk.Label(
-                self.content_frame,
-                text=f"   {word_info['root_meaning']}",
-                font=self.font_body,
-                bg=config.COLOR_BG,
-                fg=config.COLOR_BODY
-            )
-            meaning_label.pack(anchor=tk.W)
+            self.root_split_label.config(text=f"   {word_info['root_split']}")
+            self.root_meaning_label.config(text=f"   {word_info['root_meaning']}")
+            visible += [self.root_split_sep, self.root_split_title,
+                        self.root_split_label, self.root_meaning_label]
         
         # 显示释义
         if 'definition' in word_info:
-            self._add_separator()
-            
-            section_label = tk.Label(
-                self.content_frame,
-                text="💡 释义",
-                font=self.font_body,
-                bg=config.COLOR_BG,
-                fg=config.COLOR_SECTION_TITLE
-            )
-            section_label.pack(anchor=tk.W, pady=(5, 3))
-            
-            # 处理释义文本（可能很长）
-            definition = word_info['definition']
-            if len(definition) > 150:
-                definition = definition[:150] + "..."
-            
-            def_label = tk.Label(
-                self.content_frame,
-                text=f"   {definition}",
-                font=self.font_body,
-                bg=config.COLOR_BG,
-                fg=config.COLOR_BODY,
-                wraplength=config.WINDOW_WIDTH - 50,
-                justify=tk.LEFT
-            )
-            def_label.pack(anchor=tk.W)
+            # 释义可能很长，优先使用数据库预先截断好的版本
+            definition = word_info.get('definition_short', word_info['definition'])
+            self.def_label.config(text=f"   {definition}")
+            visible += [self.def_sep, self.def_title, self.def_label]
         
         # 显示真题意群（单独板块）
         if 'examples' in word_info and word_info['examples']:
-            self._add_separator()
-            section_label = tk.Label(
-                self.content_frame,
-                text="🧪 真题意群",
-                font=self.font_body,
-                bg=config.COLOR_BG,
-                fg=config.COLOR_SECTION_TITLE
-            )
-            section_label.pack(anchor=tk.W, pady=(5, 3))
-
-            examples_text = "\n".join([f"   {ex}" for ex in word_info['examples'][:2]])  # 最多显示2个
-            example_label = tk.Label(
-                self.content_frame,
-                text=examples_text,
-                font=self.font_root,
-                bg=config.COLOR_BG,
-                fg=config.COLOR_EXAMPLES,
-                wraplength=config.WINDOW_WIDTH - 50,
-                justify=tk.LEFT
-            )
-            example_label.pack(anchor=tk.W, pady=(2, 0))
+            # 优先使用数据库预先排版好的文本
+            examples_text = word_info.get('examples_text')
+            if examples_text is None:
+                examples_text = "\n".join([f"   {ex}" for ex in word_info['examples'][:2]])  # 最多显示2个
+            self.examples_label.config(text=examples_text)
+            visible += [self.examples_sep, self.examples_title, self.examples_label]
         
         # 显示相关词根
         if related_roots:
-            self._add_separator()
-            
-            section_label = tk.Label(
-                self.content_frame,
-                text="🌱 相关词根",
-                font=self.font_body,
-                bg=config.COLOR_BG,
-                fg=config.COLOR_SECTION_TITLE
-            )
-            section_label.pack(anchor=tk.W, pady=(5, 3))
-            
-            for root, meaning in related_roots[:5]:  # 最多显示5个
-                root_label = tk.Label(
-                    self.content_frame,
-                    text=f"   △ {root} = {meaning}",
-                    font=self.font_root,
-                    bg=config.COLOR_BG,
-                    fg=config.COLOR_ROOT
-                )
-                root_label.pack(anchor=tk.W)
-        
-        # 更新窗口大小
-        self.root.update_idletasks()
+            visible += [self.roots_sep, self.roots_title]
+            for root_label, (root, meaning) in zip(self.root_labels, related_roots):
+                root_label.config(text=f"   △ {root} = {meaning}")
+                visible.append(root_label)
+        
+        self._show_widgets(visible)
+        
+        # 更新窗口大小（等 Tk 在空闲时完成布局后再读取，不强制同步布局）
+        if not self._fit_scheduled:
+            self._fit_scheduled = True
+            self.root.after_idle(self._fit_height)
+    
+    def _fit_height(self):
+        """按内容高度调整窗口，高度未变化时不重设 geometry，省去一次布局"""
+        self._fit_scheduled = False
         height = min(
             max(self.content_frame.winfo_reqheight() + 80, config.WINDOW_MIN_HEIGHT),
             config.WINDOW_MAX_HEIGHT
         )
-        self.root.geometry(f"{config.WINDOW_WIDTH}x{height}")
+        if height != self._height:
+            self._height = height
+            self.root.geometry(f"{config.WINDOW_WIDTH}x{height}")
     
     def show_not_found(self, word: str):
         """显示未找到单词的提示
@@ -336,23 +336,26 @@ class FloatingWindow:
         Args:
             word: 查询的单词
         """
-        self._clear_content()
+        if self.is_hidden:
+            self._pending_update = (self.show_not_found, (word,))
+            return
         
-        label = tk.Label(
-            self.content_frame,
-            text=f"❌ 未找到单词\n\n识别结果: {word}\n\n可能原因:\n• OCR 识别错误\n• 数据库中没有此单词\n• 请重新选择识别区域",
-            font=self.font_body,
-            bg=config.COLOR_BG,
-            fg=config.COLOR_PHONETIC,
-            justify=tk.LEFT
+        self._show_message(
+            f"❌ 未找到单词\n\n识别结果: {word}\n\n可能原因:\n• OCR 识别错误\n• 数据库中没有此单词\n• 请重新选择识别区域",
+            config.COLOR_PHONETIC
         )
-        label.pack(pady=20)
     
     def show(self):
         """显示窗口"""
         if self.is_hidden:
             self.root.deiconify()
             self.is_hidden = False
+            
+            # 应用隐藏期间积压的最新内容
+            if self._pending_update:
+                func, args = self._pending_update
+                self._pending_update = None
+                func(*args)
     
     def hide(self):
         """隐藏窗口"""
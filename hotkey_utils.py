@@ -0,0 +1,123 @@
+"""
+全局快捷键模块
+Windows 上使用系统 RegisterHotKey（只在按下快捷键时唤醒），其他平台回退到 keyboard 库
+"""
+
+import platform
+import threading
+from typing import Callable, Dict, List, Tuple
+
+
+# Windows 消息和修饰键常量
+_WM_HOTKEY = 0x0312
+_MOD_NOREPEAT = 0x4000
+_MODIFIERS = {
+    'alt': 0x0001,
+    'ctrl': 0x0002,
+    'shift': 0x0004,
+    'win': 0x0008,
+}
+
+# 常用按键的虚拟键码
+_VK_CODES = {
+    'esc': 0x1B,
+    'space': 0x20,
+    'tab': 0x09,
+    'enter': 0x0D,
+}
+_VK_CODES.update({f'f{i}': 0x6F + i for i in range(1, 13)})  # F1=0x70 ... F12=0x7B
+
+
+def _parse_hotkey(hotkey: str) -> Tuple[int, int]:
+    """将 'ctrl+F2' 这类快捷键字符串解析为 (修饰键, 虚拟键码)
+
+    Raises:
+        ValueError: 无法识别的按键，或没有修饰键
+    """
+    *mods, key = [part.strip().lower() for part in hotkey.split('+')]
+
+    modifiers = 0
+    for mod in mods:
+        if mod not in _MODIFIERS:
+            raise ValueError(f"无法识别的修饰键: {mod}")
+        modifiers |= _MODIFIERS[mod]
+    # RegisterHotKey 会独占按键，不带修饰键的 F2、ESC 等将导致其他程序全部收不到
+    if not modifiers:
+        raise ValueError("必须带修饰键（如 ctrl+alt+F2），否则会独占该按键")
+
+    if key in _VK_CODES:
+        vk = _VK_CODES[key]
+    elif len(key) == 1 and key.isalnum():
+        vk = ord(key.upper())
+    else:
+        raise ValueError(f"无法识别的按键: {key}")
+
+    return modifiers, vk
+
+
+def _windows_hotkey_loop(bindings: Dict[str, Callable], ready: threading.Event, errors: List[str]):
+    """在当前线程注册快捷键并阻塞等待 WM_HOTKEY 消息
+
+    RegisterHotKey 的消息只会投递到注册它的线程。GetMessageW 在没有消息时
+    阻塞在系统调用中，不占 CPU 也不争抢 GIL
+    """
+    import ctypes
+    from ctypes import wintypes
+
+    user32 = ctypes.windll.user32
+    callbacks: Dict[int, Callable] = {}
+
+    for hotkey_id, (hotkey, callback) in enumerate(bindings.items(), start=1):
+        try:
+            modifiers, vk = _parse_hotkey(hotkey)
+        except ValueError as e:
+            errors.append(f"{hotkey}: {e}")
+            continue
+        if user32.RegisterHotKey(None, hotkey_id, modifiers | _MOD_NOREPEAT, vk):
+            callbacks[hotkey_id] = callback
+        else:
+            errors.append(f"{hotkey}: 已被其他程序占用")
+
+    ready.set()
+    if not callbacks:
+        return
+
+    msg = wintypes.MSG()
+    while user32.GetMessageW(ctypes.byref(msg), None, 0, 0) > 0:
+        if msg.message == _WM_HOTKEY:
+            callback = callbacks.get(msg.wParam)
+            if callback:
+                try:
+                    callback()
+                except Exception as e:
+                    print(f"⚠️  快捷键处理出错: {e}")
+
+
+def register_hotkeys(bindings: Dict[str, Callable]):
+    """注册全局快捷键
+
+    回调会在快捷键线程中执行，涉及 GUI 的操作需自行转交主线程。
+    Windows 上的热键由本程序独占，因此要求每个快捷键都带修饰键
+
+    Args:
+        bindings: {快捷键字符串: 回调函数}
+
+    Raises:
+        OSError: 部分快捷键注册失败
+    """
+    if platform.system() != 'Windows':
+        import keyboard
+        for hotkey, callback in bindings.items():
+            keyboard.add_hotkey(hotkey, callback)
+        return
+
+    ready = threading.Event()
+    errors: List[str] = []
+    thread = threading.Thread(
+        target=_windows_hotkey_loop, args=(bindings, ready, errors), daemon=True
+    )
+    thread.start()
+    ready.wait()
+
+    if errors:
+        raise OSError("；".join(errors))
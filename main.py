@@ -4,11 +4,12 @@ BBDC Plus - 背单词增强工具
 """
 
 import sys
+import platform
 import threading
 import time
 import queue
+import tkinter as tk
 from typing import Optional, Tuple
-import keyboard
 import config
 
 # 导入自定义模块
@@ -17,8 +18,13 @@ from screen_selector import ScreenSelector
 from ocr_engine import OCREngine
 from floating_window import FloatingWindow
 from dpi_utils import get_dpi_manager
+from hotkey_utils import register_hotkeys
 
 
+# 主线程检查识别结果队列的间隔（毫秒）
+_RESULT_POLL_MS = 50
+_RESULT_POLL_PAUSED_MS = 500
+
 class BBDCPlus:
     def __init__(self):
         """初始化应用"""
@@ -31,11 +37,14 @@ class BBDCPlus:
         self.dpi_manager = get_dpi_manager()
         
         # 初始化各个模块
-        print("\n📚 正在加载数据库...")
+        # OCR 模型加载与数据库解析互不依赖，放到后台线程并行进行
+        print("\n🔍 初始化 OCR 引擎（后台加载）...")
+        threading.Thread(target=OCREngine.get_shared, daemon=True).start()
+        
+        print("📚 正在加载数据库...")
         self.database = WordDatabase(config.DATABASE_FILE)
         
-        print("🔍 初始化 OCR 引擎...")
-        # 使用共享实例，避免重复加载模型
+        # 使用共享实例，避免重复加载模型（若仍在加载则等待完成）
         self.ocr = OCREngine.get_shared()
         
         print("🖼️  创建悬浮窗...")
@@ -50,6 +59,12 @@ class BBDCPlus:
         # 命令队列（用于线程安全的快捷键处理）
         self.command_queue = queue.Queue()
         
+        # 识别结果队列（OCR 线程写入，主线程取出后刷新悬浮窗）
+        self.result_queue = queue.Queue()
+        
+        # 快捷键线程投递命令后触发虚拟事件，由主线程处理命令队列
+        self.window.root.bind('<<Command>>', self._process_commands)
+        
         # 注册全局快捷键
         self._register_hotkeys()
         
@@ -64,23 +79,38 @@ class BBDCPlus:
         print(f"   {config.HOTKEY_EXIT} - 退出程序")
         
         try:
-            keyboard.add_hotkey(config.HOTKEY_RESELECT, self._on_reselect)
-            keyboard.add_hotkey(config.HOTKEY_TOGGLE, self._on_toggle)
-            keyboard.add_hotkey(config.HOTKEY_PAUSE, self._on_pause)
-            keyboard.add_hotkey(config.HOTKEY_EXIT, self._on_exit)
+            register_hotkeys({
+                config.HOTKEY_RESELECT: self._on_reselect,
+                config.HOTKEY_TOGGLE: self._on_toggle,
+                config.HOTKEY_PAUSE: self._on_pause,
+                config.HOTKEY_EXIT: self._on_exit,
+            })
         except Exception as e:
             print(f"⚠️  快捷键注册失败: {e}")
-            print("   提示：请以管理员权限运行程序")
+            print("   提示：快捷键需带修饰键（如 ctrl+alt+F2），且不能与其他程序冲突，可在 config.py 中修改")
+    
+    def _post_command(self, command: str):
+        """将命令放入队列，并通知主线程处理"""
+        self.command_queue.put(command)
+        try:
+            # event_generate 可跨线程调用，事件会排到主线程的事件队列末尾
+            self.window.root.event_generate('<<Command>>', when='tail')
+        except RuntimeError as e:
+            # 主循环尚未启动（首次选择区域期间）：命令留在队列中，由 run() 在进入主循环时处理
+            print(f"⚠️  主循环未就绪，命令 {command} 将稍后处理: {e}")
+        except tk.TclError:
+            # 窗口已销毁（正在退出）时忽略
+            pass
     
     def _on_reselect(self):
         """重新选择屏幕区域"""
         # 将命令放入队列，由主线程处理
-        self.command_queue.put('reselect')
+        self._post_command('reselect')
     
     def _on_toggle(self):
         """切换悬浮窗显示/隐藏"""
         # 将命令放入队列，由主线程处理
-        self.command_queue.put('toggle')
+        self._post_command('toggle')
     
     def _on_pause(self):
         """暂停/继续识别"""
@@ -94,10 +124,10 @@ class BBDCPlus:
         # 将命令放入队列，由主线程处理
         print("\n👋 正在退出...")
         self.is_running = False
-        self.command_queue.put('exit')
+        self._post_command('exit')
     
-    def _process_commands(self):
-        """处理命令队列（在主线程中周期性调用）"""
+    def _process_commands(self, event=None):
+        """处理命令队列（在主线程中由 <<Command>> 事件触发）"""
         try:
             while not self.command_queue.empty():
                 command = self.command_queue.get_nowait()
@@ -117,10 +147,31 @@ class BBDCPlus:
         
         except queue.Empty:
             pass
+    
+    def _drain_results(self):
+        """取出识别结果并刷新悬浮窗（在主线程中周期性调用）
+        
+        OCR 线程只往队列里放结果，从不调用 Tk；只显示队列中最新的一条，过期的结果直接丢弃
+        """
+        latest = None
+        try:
+            while True:
+                latest = self.result_queue.get_nowait()
+        except queue.Empty:
+            pass
         
-        # 继续周期性检查命令队列
+        if latest is not None:
+            if latest[0] == 'hit':
+                _, word_info, related_roots = latest
+                self.window.update_word(word_info, related_roots)
+            else:
+                _, word = latest
+                self.window.show_not_found(word)
+        
+        # 继续周期性检查结果队列；暂停识别时不会有新结果，降低检查频率
         if self.is_running:
-            self.window.root.after(100, self._process_commands)
+            interval = _RESULT_POLL_PAUSED_MS if self.is_paused else _RESULT_POLL_MS
+            self.window.root.after(interval, self._drain_results)
     
     def select_region(self) -> bool:
         """选择屏幕识别区域
@@ -149,8 +200,20 @@ class BBDCPlus:
         last_word = None
         loop_count = 0
         
+        # Windows 上降低 OCR 线程优先级，让 GUI 线程优先响应
+        if platform.system() == 'Windows':
+            try:
+                import ctypes
+                kernel32 = ctypes.windll.kernel32
+                kernel32.SetThreadPriority(kernel32.GetCurrentThread(), -1)  # THREAD_PRIORITY_BELOW_NORMAL
+            except Exception as e:
+                print(f"⚠️  设置识别线程优先级失败: {e}")
+        
         print(f"\n🔄 开始识别循环（每 {config.OCR_INTERVAL} 秒）")
-        print("   按 F4 暂停/继续，按 ESC 退出\n")
+        print(f"   按 {config.HOTKEY_PAUSE} 暂停/继续，按 {config.HOTKEY_EXIT} 退出\n")
+        
+        # 以单调时钟按固定节奏调度，识别耗时不会累加到周期上
+        next_deadline = time.monotonic()
         
         while self.is_running:
             try:
@@ -158,7 +221,6 @@ class BBDCPlus:
                 
                 # 如果暂停，跳过识别
                 if self.is_paused:
-                    time.sleep(0.5)
                     continue
                 
                 # 显示识别进度（每5次显示一次）
@@ -172,7 +234,6 @@ class BBDCPlus:
                     print(f"🔍 识别结果: {words if words else '(空)'}")
                 
                 if not words:
-                    time.sleep(config.OCR_INTERVAL)
                     continue
                 
                 # 获取主要单词
@@ -185,7 +246,6 @@ class BBDCPlus:
                 if not self.ocr.should_update(primary_word):
                     if config.DEBUG:
                         print(f"   → 和上次相同，跳过")
-                    time.sleep(config.OCR_INTERVAL)
                     continue
                 
                 # 查询数据库
@@ -199,7 +259,7 @@ class BBDCPlus:
                     related_roots = self.database.get_related_roots(word_info)
                     
                     # 更新悬浮窗
-                    self.window.root.after(0, lambda: self.window.update_word(word_info, related_roots))
+                    self.result_queue.put(('hit', word_info, related_roots))
                     
                     # 输出日志
                     match_info = ""
@@ -208,7 +268,7 @@ class BBDCPlus:
                     print(f"✅ {primary_word}{match_info} - {word_info.get('definition', '')[:50]}")
                 else:
                     # 未找到
-                    self.window.root.after(0, lambda w=primary_word: self.window.show_not_found(w))
+                    self.result_queue.put(('miss', primary_word))
                     print(f"❌ 未找到: {primary_word}")
                 
                 last_word = primary_word
@@ -219,8 +279,15 @@ class BBDCPlus:
                     import traceback
                     traceback.print_exc()
             
-            # 等待下一次识别
-            time.sleep(config.OCR_INTERVAL)
+            finally:
+                # 等待下一次识别（continue 跳出时同样经过这里）
+                next_deadline += config.OCR_INTERVAL
+                delay = next_deadline - time.monotonic()
+                if delay > 0:
+                    time.sleep(delay)
+                else:
+                    # 已落后整个周期：不连续补跑，从当前时刻重新计时
+                    next_deadline = time.monotonic()
     
     def run(self):
         """运行应用"""
@@ -237,8 +304,11 @@ class BBDCPlus:
         self.ocr_thread = threading.Thread(target=self._ocr_loop, daemon=True)
         self.ocr_thread.start()
         
-        # 启动命令处理循环
-        self.window.root.after(100, self._process_commands)
+        # 首次选择区域期间主循环尚未启动，期间按下的快捷键命令还在队列里，进入主循环后立即处理
+        self.window.root.after(0, self._process_commands)
+        
+        # 启动识别结果刷新循环
+        self.window.root.after(_RESULT_POLL_MS, self._drain_results)
         
         # 运行 GUI 主循环
         try:
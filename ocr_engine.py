@@ -3,24 +3,75 @@ OCR 识别引擎
 使用 RapidOCR 识别屏幕指定区域的文字
 """
 
+import hashlib
+import os
 import re
-from typing import List, Optional, Tuple
-from PIL import ImageGrab, Image
-from rapidocr_onnxruntime import RapidOCR
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Tuple, Union
+from PIL import Image
+import mss
 import numpy as np
 from dpi_utils import get_dpi_manager
 import config
 
 
+# 最近识别过的画面数量（画面摘要 → 单词列表）
+_OCR_CACHE_SIZE = 16
+
+# RGB → 亮度的权重（ITU-R 601，与 PIL 的 'L' 模式一致）
+_LUMA_WEIGHTS = np.array([0.299, 0.587, 0.114])
+
+def _ocr_thread_count() -> int:
+    """模型推理使用的线程数
+    
+    onnxruntime 默认按逻辑核数开线程，超线程机器上同一物理核的两个线程会互相争抢，
+    反而更慢；未配置时取逻辑核数的一半作为物理核数的近似
+    """
+    threads = getattr(config, 'OCR_NUM_THREADS', 0)
+    if threads > 0:
+        return threads
+    return max(1, (os.cpu_count() or 2) // 2)
+
+
+def _ocr_model_options() -> Dict[str, str]:
+    """config 中自定义的模型路径（如量化模型），未配置的项沿用 RapidOCR 内置模型"""
+    options = {}
+    for key, name in (('det_model_path', 'OCR_DET_MODEL_PATH'),
+                      ('cls_model_path', 'OCR_CLS_MODEL_PATH'),
+                      ('rec_model_path', 'OCR_REC_MODEL_PATH')):
+        path = getattr(config, name, '')
+        if path:
+            options[key] = path
+    return options
+
+
+# 英文单词（至少 2 个字母）
+_WORD_RE = re.compile(r'\b[A-Za-z]{2,}\b')
+
+# 统计整数中 1 的个数（Python 3.10+ 使用 C 实现的 int.bit_count）
+if hasattr(int, 'bit_count'):
+    _popcount = int.bit_count
+else:
+    def _popcount(x: int) -> int:
+        return bin(x).count('1')
+
+
 class OCREngine:
     _shared_instance = None
+    _shared_lock = threading.Lock()
 
     @classmethod
     def get_shared(cls):
-        """获取共享的 OCR 实例（单例，避免重复加载模型）"""
-        if cls._shared_instance is None:
-            cls._shared_instance = OCREngine()
-        return cls._shared_instance
+        """获取共享的 OCR 实例（单例，避免重复加载模型）
+        
+        线程安全：后台预加载时，其他调用方会等待加载完成后拿到同一实例
+        """
+        with cls._shared_lock:
+            if cls._shared_instance is None:
+                cls._shared_instance = OCREngine()
+            return cls._shared_instance
     def __init__(self):
         """初始化 OCR 引擎"""
         self.last_recognized_word = None
@@ -29,13 +80,42 @@ class OCREngine:
         # 获取 DPI 管理器
         self.dpi_manager = get_dpi_manager()
         self._last_image_hash: Optional[int] = None
+        self._last_frame_digest: Optional[bytes] = None
+        # 最近识别结果缓存（LRU）：切回逐字节相同的画面时直接复用，不再跑 OCR
+        self._ocr_cache: "OrderedDict[bytes, List[str]]" = OrderedDict()
+        # 感知哈希的复用缓冲区（只在识别循环线程中使用）
+        self._hash_gray = np.empty((8, 9), dtype=np.float64)
+        self._hash_bits = np.empty((8, 8), dtype=bool)
+        # 最近一次提取结果及其中最长的单词：(单词列表, 主单词)
+        self._last_extracted: Tuple[List[str], Optional[str]] = ([], None)
+        # 截图会话（每个线程首次截图时创建，之后复用同一个 DC）
+        self._local = threading.local()
+        # 逻辑区域 → mss 截图区域（物理坐标），DPI 在运行期间不变，每个区域只换算一次
+        self._monitor_cache: Dict[Tuple[int, int, int, int], Dict[str, int]] = {}
+        # 多区域并行识别时模型推理串行
+        self._ocr_lock = threading.Lock()
+        self.reload_config()
         
         # 初始化 RapidOCR
+        # 延迟导入：onnxruntime 初始化较慢，只在真正创建引擎时（通常在后台预加载线程中）导入
         print("   正在加载 RapidOCR 模型...")
-        self.ocr = RapidOCR()
+        from rapidocr_onnxruntime import RapidOCR
+        self.ocr = RapidOCR(intra_op_num_threads=_ocr_thread_count(), **_ocr_model_options())
         print("   ✅ RapidOCR 加载完成")
     
-    def capture_region(self, x: int, y: int, width: int, height: int) -> Image.Image:
+    def reload_config(self):
+        """从 config 读取识别相关配置并缓存到实例上
+        
+        识别循环每帧都会用到这些值，修改 config 后调用本方法生效
+        """
+        self._debug = getattr(config, 'DEBUG', False)
+        self._fast_mode = getattr(config, 'OCR_FAST_MODE', True)
+        self._max_width = getattr(config, 'OCR_MAX_WIDTH', 900)
+        self._downscale = getattr(config, 'OCR_DOWNSCALE', 0.75)
+        self._bin_threshold = getattr(config, 'OCR_BIN_THRESHOLD', 180)
+        self._hash_threshold = getattr(config, 'IMAGE_HASH_DIFF_THRESHOLD', 2)
+    
+    def capture_region(self, x: int, y: int, width: int, height: int) -> np.ndarray:
         """截取屏幕指定区域
         
         Args:
@@ -45,63 +125,78 @@ class OCREngine:
             height: 区域高度（逻辑坐标）
         
         Returns:
-            PIL Image 对象
+            RGB 图像数组，形状为 (高, 宽, 3)
         """
-        # 应用 DPI 缩放（转换为物理坐标）
-        scaled_x, scaled_y, scaled_width, scaled_height = self.dpi_manager.scale_coordinates(
-            x, y, width, height
-        )
-        
-        # 调试输出：打印逻辑/物理坐标对照
-        try:
-            import config
-            if getattr(config, 'DEBUG', False):
+        return self._grab(x, y, width, height)[0]
+    
+    def _grab(self, x: int, y: int, width: int, height: int) -> Tuple[np.ndarray, bytearray]:
+        """截图并同时返回 RGB 视图和 mss 的原始 BGRA 缓冲区（连续内存，可直接计算摘要）"""
+        key = (x, y, width, height)
+        monitor = self._monitor_cache.get(key)
+        if monitor is None:
+            # 应用 DPI 缩放（转换为物理坐标）
+            scaled_x, scaled_y, scaled_width, scaled_height = self.dpi_manager.scale_coordinates(
+                x, y, width, height
+            )
+            
+            # 调试输出：打印逻辑/物理坐标对照
+            if self._debug:
                 print(f"📐 OCR 截图坐标: 逻辑=({x},{y},{width},{height}) → 物理=({scaled_x},{scaled_y},{scaled_width},{scaled_height})")
-        except Exception:
-            pass
+            
+            monitor = self._monitor_cache[key] = {
+                'left': scaled_x, 'top': scaled_y,
+                'width': scaled_width, 'height': scaled_height,
+            }
         
         # 截取屏幕区域（使用物理坐标）
-        bbox = (scaled_x, scaled_y, scaled_x + scaled_width, scaled_y + scaled_height)
-        screenshot = ImageGrab.grab(bbox)
-        return screenshot
+        # mss 的 DC 句柄与线程绑定，因此在实际截图的线程里创建并复用
+        sct = getattr(self._local, 'sct', None)
+        if sct is None:
+            sct = self._local.sct = mss.mss()
+        raw = sct.grab(monitor)
+        # BGRA 原始数据零拷贝视为数组，取前三个通道并倒序得到 RGB
+        # （raw.bgra 每次都会复制一份 bytes，这里直接用底层的 raw.raw）
+        bgra = np.frombuffer(raw.raw, dtype=np.uint8).reshape(raw.height, raw.width, 4)
+        return bgra[..., 2::-1], raw.raw
     
-    def recognize_text(self, image: Image.Image) -> str:
+    def recognize_text(self, image: Union[Image.Image, np.ndarray]) -> str:
         """识别图片中的文字
         
         Args:
-            image: PIL Image 对象
+            image: PIL Image 对象或 RGB 图像数组
         
         Returns:
             识别出的文字
         """
         try:
             # 快速预处理：灰度 + 下采样 + 二值化（再转回RGB，兼容模型）
-            if getattr(config, 'OCR_FAST_MODE', True):
+            if self._fast_mode:
+                if isinstance(image, np.ndarray):
+                    image = Image.fromarray(image)
                 img = image.convert('L')
                 w, h = img.size
                 # 限制输入大小并按比例缩放
-                max_w = getattr(config, 'OCR_MAX_WIDTH', 900)
-                scale = getattr(config, 'OCR_DOWNSCALE', 0.75)
+                max_w = self._max_width
+                scale = self._downscale
                 target_w = min(int(w * scale), max_w) if w > 0 else w
                 if target_w > 0 and target_w < w:
                     target_h = max(1, int(h * target_w / w))
                     img = img.resize((target_w, target_h), Image.BILINEAR)
-                # 二值化
-                thr = getattr(config, 'OCR_BIN_THRESHOLD', 180)
-                img = img.point(lambda p: 255 if p > thr else 0, mode='1')
-                # 转回三通道
-                img = img.convert('RGB')
+                # 二值化并以广播视图扩展为三通道（零拷贝，RapidOCR 可直接读取）
+                thr = self._bin_threshold
+                binary = np.where(np.asarray(img) > thr, np.uint8(255), np.uint8(0))
+                img_array = np.broadcast_to(binary[..., None], binary.shape + (3,))
+            elif isinstance(image, np.ndarray):
+                # 截图数组可直接交给模型
+                img_array = np.ascontiguousarray(image)
             else:
-                img = image.convert('RGB')
-
-            # 转换为 numpy 数组（RapidOCR 需要）
-            img_array = np.array(img)
+                img_array = np.array(image.convert('RGB'))
             
             # 使用 RapidOCR 识别
             # result 格式: [[[box], text, confidence], ...]
-            result, elapse = self.ocr(img_array)
-            
-            self.recognition_count += 1
+            with self._ocr_lock:
+                result, elapse = self.ocr(img_array)
+                self.recognition_count += 1
             
             # 如果没有识别结果
             if not result:
@@ -118,25 +213,32 @@ class OCREngine:
             return ""
 
     # ---- 图像变化检测 ----
-    def _compute_ahash(self, image: Image.Image) -> int:
-        """计算图像的 aHash（平均哈希），返回 64bit 整数"""
-        img = image.convert('L').resize((8, 8), Image.BILINEAR)
-        arr = np.asarray(img, dtype=np.float32)
-        mean = arr.mean()
-        bits = (arr > mean).astype(np.uint8).flatten()
-        value = 0
-        for b in bits:
-            value = (value << 1) | int(b)
-        return int(value)
+    def _compute_dhash(self, image: Union[Image.Image, np.ndarray]) -> int:
+        """计算图像的 dHash（差异哈希），返回 64bit 整数
+        
+        比较相邻像素的明暗关系，整体亮度变化不会改变哈希
+        """
+        arr = image if isinstance(image, np.ndarray) else np.asarray(image.convert('RGB'))
+        h, w = arr.shape[:2]
+        if h < 8 or w < 9:
+            # 区域比 9x8 还小，无法分块，直接缩放到 9x8
+            arr = np.asarray(Image.fromarray(arr).resize((9, 8), Image.BOX))
+            h, w = 8, 9
+        # 按 8 行 9 列分块（块边界均匀分布，覆盖全部像素）求和，除以各块像素数得到块均值，
+        # 再换算成亮度；区域平均对文字的细微变化更稳定
+        row_edges = np.linspace(0, h, 9).astype(int)
+        col_edges = np.linspace(0, w, 10).astype(int)
+        blocks = np.add.reduceat(arr, row_edges[:-1], axis=0, dtype=np.int64)
+        blocks = np.add.reduceat(blocks, col_edges[:-1], axis=1)
+        gray = np.dot(blocks, _LUMA_WEIGHTS, out=self._hash_gray)
+        gray /= np.outer(np.diff(row_edges), np.diff(col_edges))
+        np.greater(gray[:, 1:], gray[:, :-1], out=self._hash_bits)
+        # 64 个比特按行优先、高位在前打包成 8 字节，再转为整数
+        packed = np.packbits(self._hash_bits.ravel())
+        return int.from_bytes(packed.tobytes(), 'big')
 
     def _hamming_distance(self, a: int, b: int) -> int:
-        x = a ^ b
-        # Brian Kernighan 技巧
-        cnt = 0
-        while x:
-            x &= x - 1
-            cnt += 1
-        return cnt
+        return _popcount(a ^ b)
     
     def extract_words(self, text: str) -> List[str]:
         """从识别的文本中提取英文单词
@@ -147,23 +249,28 @@ class OCREngine:
         Returns:
             单词列表
         """
-        print(text)
+        if self._debug:
+            print(f"🔤 OCR 文本: {text}")
         if not text:
             return []
         
-        # 使用正则提取所有英文单词（至少2个字母）
-        words = re.findall(r'\b[a-zA-Z]{2,}\b', text)
-        
-        # 转为小写并去重（保持顺序）
+        # 提取所有英文单词（至少2个字母），转为小写并去重（保持顺序），
+        # 同时记下最长的单词，供 get_primary_word 直接取用
+        words = []
         seen = set()
-        unique_words = []
-        for word in words:
-            word_lower = word.lower()
-            if word_lower not in seen:
-                seen.add(word_lower)
-                unique_words.append(word_lower)
-        
-        return unique_words
+        primary = None
+        primary_len = 0
+        for match in _WORD_RE.findall(text):
+            word = match.lower()
+            if word in seen:
+                continue
+            seen.add(word)
+            words.append(word)
+            if len(word) > primary_len:
+                primary, primary_len = word, len(word)
+        
+        self._last_extracted = (words, primary)
+        return words
     
     def recognize_region(self, x: int, y: int, width: int, height: int) -> List[str]:
         """识别屏幕区域中的单词
@@ -178,20 +285,39 @@ class OCREngine:
             识别出的单词列表
         """
         # 截取屏幕
-        image = self.capture_region(x, y, width, height)
+        image, buffer = self._grab(x, y, width, height)
         
-        # 屏幕未变化则跳过 OCR
+        # 画面逐字节完全相同（静止画面最常见）：直接跳过，连感知哈希也不必计算
+        # 对连续的原始缓冲区求摘要，避免为 RGB 视图再复制一份
+        digest = hashlib.blake2b(buffer, digest_size=8).digest()
+        if digest == self._last_frame_digest:
+            if self._debug:
+                print("🧩 画面未变化，跳过 OCR")
+            return []
+        self._last_frame_digest = digest
+        
+        # 屏幕未明显变化则跳过 OCR
         try:
-            current_hash = self._compute_ahash(image)
+            current_hash = self._compute_dhash(image)
+        except Exception:
+            current_hash = None
+        if current_hash is not None:
             if self._last_image_hash is not None:
                 diff = self._hamming_distance(self._last_image_hash, current_hash)
-                if diff <= getattr(config, 'IMAGE_HASH_DIFF_THRESHOLD', 2):
-                    if getattr(config, 'DEBUG', False):
+                if diff <= self._hash_threshold:
+                    if self._debug:
                         print(f"🧩 图像未变化(H={diff})，跳过 OCR")
                     return []
             self._last_image_hash = current_hash
-        except Exception:
-            pass
+        
+        # 与最近识别过的某个画面完全相同：直接返回当时的结果
+        # （只认精确摘要：布局相同的不同单词 dHash 很容易相近，近似命中会显示错词）
+        cached = self._ocr_cache.get(digest)
+        if cached is not None:
+            self._ocr_cache.move_to_end(digest)
+            if self._debug:
+                print("🧩 命中识别缓存，跳过 OCR")
+            return list(cached)
         
         # 识别文字
         text = self.recognize_text(image)
@@ -199,8 +325,43 @@ class OCREngine:
         # 提取单词
         words = self.extract_words(text)
         
+        # 只缓存有结果的画面，避免偶发识别失败被反复复用
+        if words:
+            self._ocr_cache[digest] = words
+            if len(self._ocr_cache) > _OCR_CACHE_SIZE:
+                self._ocr_cache.popitem(last=False)
+        
         return words
     
+    def recognize_regions(self, regions: List[Tuple[int, int, int, int]]) -> List[List[str]]:
+        """并行识别多个屏幕区域中的单词
+        
+        不做画面变化检测（该状态只对应单个监视区域），每个区域都会完整识别
+        
+        Args:
+            regions: [(x, y, width, height), ...]
+        
+        Returns:
+            与 regions 一一对应的单词列表
+        """
+        def recognize(region):
+            try:
+                image = self.capture_region(*region)
+                return self.extract_words(self.recognize_text(image))
+            finally:
+                # 工作线程用完即退出，关闭它的截图会话，避免 DC 句柄泄漏
+                sct = getattr(self._local, 'sct', None)
+                if sct is not None:
+                    sct.close()
+                    del self._local.sct
+        
+        if not regions:
+            return []
+        # 截图和预处理并行，模型推理串行（onnxruntime 推理时会释放 GIL）
+        # 线程池只在多区域识别时临时创建，单区域识别循环不占用额外线程
+        with ThreadPoolExecutor(max_workers=min(2, len(regions)), thread_name_prefix='ocr') as pool:
+            return list(pool.map(recognize, regions))
+    
     def get_primary_word(self, words: List[str]) -> Optional[str]:
         """从单词列表中获取主要单词（通常是最长的）
         
@@ -213,6 +374,11 @@ class OCREngine:
         if not words:
             return None
         
+        # 刚由 extract_words 提取的列表，主单词已在提取时算好
+        last_words, primary = self._last_extracted
+        if words is last_words:
+            return primary
+        
         # 返回最长的单词（通常背单词软件会突出显示主单词）
         return max(words, key=len)
     
@@ -256,9 +422,9 @@ def main():
     ocr = OCREngine()
     
     # 获取屏幕中心区域
-    from PIL import ImageGrab
-    screen = ImageGrab.grab()
-    screen_width, screen_height = screen.size
+    with mss.mss() as sct:
+        monitor = sct.monitors[1]
+    screen_width, screen_height = monitor['width'], monitor['height']
     
     # 截取中心区域
     x = screen_width // 2 - 150
@@ -30,6 +30,9 @@ class ScreenSelector:
         self.start_y = None
         self.rect = None
         self.text = None
+        # 拖拽重绘合并：只记录最新鼠标位置，空闲时统一重绘一次
+        self._pending_pos: Optional[Tuple[int, int]] = None
+        self._redraw_job = None
     
     def select_region(self) -> Tuple[int, int, int, int]:
         """显示选择界面，返回选中的区域
@@ -104,57 +107,75 @@ class ScreenSelector:
         self.start_x = event.x
         self.start_y = event.y
         
-        # 创建矩形
-        if self.rect:
-            self.canvas.delete(self.rect)
-        if self.text:
-            self.canvas.delete(self.text)
+        # 矩形和尺寸文字只创建一次，拖拽时原地更新坐标和内容
+        if self.rect is None:
+            self.rect = self.canvas.create_rectangle(
+                0, 0, 0, 0,
+                outline='red',
+                width=3,
+                fill='white',
+                stipple='gray50',  # 半透明填充
+                state='hidden'
+            )
+            self.text = self.canvas.create_text(
+                0, 0,
+                font=('Arial', 14, 'bold'),
+                fill='red',
+                state='hidden'
+            )
+        else:
+            self._hide_selection()
     
     def _on_mouse_move(self, event):
         """鼠标移动事件"""
         if self.start_x is None or self.start_y is None:
             return
         
+        # 鼠标移动事件远比屏幕刷新频繁，合并到空闲时只重绘一次
+        self._pending_pos = (event.x, event.y)
+        if self._redraw_job is None:
+            self._redraw_job = self.root.after_idle(self._redraw_selection)
+    
+    def _redraw_selection(self):
+        """按最新的鼠标位置重绘选择框"""
+        self._redraw_job = None
+        if self.start_x is None or self.start_y is None or self._pending_pos is None:
+            return
+        end_x, end_y = self._pending_pos
+        
         # 更新矩形
-        if self.rect:
-            self.canvas.delete(self.rect)
-        if self.text:
-            self.canvas.delete(self.text)
-        
-        # 绘制新矩形
-        self.rect = self.canvas.create_rectangle(
-            self.start_x,
-            self.start_y,
-            event.x,
-            event.y,
-            outline='red',
-            width=3,
-            fill='white',
-            stipple='gray50'  # 半透明填充
-        )
+        self.canvas.coords(self.rect, self.start_x, self.start_y, end_x, end_y)
+        self.canvas.itemconfigure(self.rect, state='normal')
         
         # 显示尺寸信息
-        width = abs(event.x - self.start_x)
-        height = abs(event.y - self.start_y)
+        width = abs(end_x - self.start_x)
+        height = abs(end_y - self.start_y)
         info_text = f"{width} × {height}"
         
         # 文字位置在矩形上方
-        text_x = (self.start_x + event.x) / 2
-        text_y = min(self.start_y, event.y) - 10
-        
-        self.text = self.canvas.create_text(
-            text_x,
-            text_y,
-            text=info_text,
-            font=('Arial', 14, 'bold'),
-            fill='red'
-        )
+        text_x = (self.start_x + end_x) / 2
+        text_y = min(self.start_y, end_y) - 10
+        
+        self.canvas.coords(self.text, text_x, text_y)
+        self.canvas.itemconfigure(self.text, text=info_text, state='normal')
+    
+    def _hide_selection(self):
+        """隐藏选择框和尺寸文字（保留画布元素以便复用）"""
+        if self.rect is not None:
+            self.canvas.itemconfigure(self.rect, state='hidden')
+            self.canvas.itemconfigure(self.text, state='hidden')
     
     def _on_mouse_up(self, event):
         """鼠标释放事件"""
         if self.start_x is None or self.start_y is None:
             return
         
+        # 松开后不再需要等待中的重绘
+        if self._redraw_job is not None:
+            self.root.after_cancel(self._redraw_job)
+            self._redraw_job = None
+        self._pending_pos = None
+        
         # 计算选中区域（确保 x, y 是左上角坐标）
         x1 = min(self.start_x, event.x)
         y1 = min(self.start_y, event.y)
@@ -169,10 +190,7 @@ class ScreenSelector:
             print("⚠️ 选择区域太小，请重新选择")
             self.start_x = None
             self.start_y = None
-            if self.rect:
-                self.canvas.delete(self.rect)
-            if self.text:
-                self.canvas.delete(self.text)
+            self._hide_selection()
             return
         
         # 将物理坐标转换成逻辑坐标再返回，避免后续重复缩放